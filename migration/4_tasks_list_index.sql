@@ -0,0 +1,9 @@
+-- Migration 4: Tasks list index
+-- Composite index for TaskService.list_tasks, which filters by project_id and
+-- orders by task_order then created_at. Status is left out: the default listing
+-- filters it with neq('done'), so a status column ahead of task_order would
+-- force Postgres to sort the result instead of reading it in index order.
+-- Idempotent - safe to run on existing installs.
+
+create index if not exists idx_tasks_project_order_created
+  on tasks(project_id, task_order, created_at);
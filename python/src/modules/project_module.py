@@ -44,7 +44,9 @@ def register_project_tools(mcp: FastMCP):
         project_id: str = None,
         title: str = None,
         prd: Dict[str, Any] = None,
-        github_repo: str = None
+        github_repo: str = None,
+        limit: int = None,
+        cursor: str = None
     ) -> str:
         """
         Unified tool for project management operations.
@@ -55,6 +57,9 @@ def register_project_tools(mcp: FastMCP):
             title: Project title (required for create)
             prd: Product requirements document as JSON (optional for create)
             github_repo: GitHub repository URL (optional for create)
+            limit: Maximum number of projects to return, at least 1 (optional for list).
+                   When set, total_count is the page size and next_cursor is returned.
+            cursor: next_cursor from a previous paged list response (optional for list)
         
         Returns:
             JSON string with operation results
@@ -62,6 +67,7 @@ def register_project_tools(mcp: FastMCP):
         Examples:
             Create: manage_project(action="create", title="My App", github_repo="https://github.com/user/repo")
             List: manage_project(action="list")
+            Paged list: manage_project(action="list", limit=20, cursor="<next_cursor from previous page>")
             Get: manage_project(action="get", project_id="uuid-here")
             Delete: manage_project(action="delete", project_id="uuid-here")
         """
@@ -104,7 +110,7 @@ def register_project_tools(mcp: FastMCP):
                     return json.dumps({"success": success, **result})
                 
                 elif action == "list":
-                    success, result = service.list_projects()
+                    success, result = service.list_projects(limit=limit, cursor=cursor)
                     span.set_attribute("success", success)
                     if success:
                         span.set_attribute("project_count", len(result.get("projects", [])))
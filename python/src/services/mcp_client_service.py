@@ -91,6 +91,8 @@ class MCPClientService:
     - Handles automatic reconnection on failures
     """
     
+    MAX_CONCURRENT_DISCOVERY = 32  # Max clients queried at once by get_all_tools/health checks
+    
     def __init__(self):
         self.clients: Dict[str, MCPClientInfo] = {}
         self.sessions: Dict[str, ClientSession] = {}
@@ -101,6 +103,8 @@ class MCPClientService:
         self._running = False
         self._reconnect_tasks: Dict[str, asyncio.Task] = {}  # Track reconnection tasks
         self._reconnect_delays: Dict[str, float] = {}  # Track backoff delays
+        self._discovery_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DISCOVERY)  # Bound fan-out to servers
+        self._http_client: Optional[httpx.AsyncClient] = None  # Shared by all SSE sessions
         
     async def start(self):
         """Start the MCP client service"""
@@ -131,6 +135,11 @@ class MCPClientService:
         for client_id in list(self.clients.keys()):
             await self.disconnect_client(client_id)
             
+        # Close the shared HTTP client once no session is using it
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            
     # ========================================
     # CLIENT MANAGEMENT
     # ========================================
@@ -354,9 +363,7 @@ class MCPClientService:
                 if hasattr(session, '_transport_client_id'):
                     transport_id = session._transport_client_id
                     if transport_id in self._sse_contexts:
-                        context = self._sse_contexts[transport_id]
-                        if 'http_client' in context:
-                            await context['http_client'].aclose()
+                        # The HTTP client is shared across sessions and closed in stop()
                         del self._sse_contexts[transport_id]
             except Exception as e:
                 logger.warning(f"Error closing session for {client_id}: {e}")
@@ -383,6 +390,15 @@ class MCPClientService:
     # SSE TRANSPORT IMPLEMENTATION
     # ========================================
     
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use or after stop()"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+            )
+        return self._http_client
+    
     async def _create_sse_session_direct(self, config: MCPClientConfig) -> ClientSession:
         """Create SSE transport session with proper MCP protocol implementation"""
         url = config.connection_config.get('url')
@@ -396,7 +412,7 @@ class MCPClientService:
         session_info = {
             'url': url,
             'session_id': None,
-            'http_client': httpx.AsyncClient(timeout=httpx.Timeout(30.0)),
+            'http_client': self._get_http_client(),
             'connected': False
         }
         
@@ -543,9 +559,8 @@ class MCPClientService:
         except Exception as e:
             mcp_logger.error(f"SSE message handler error: {e}", exc_info=True)
         finally:
-            # Cleanup
+            # Cleanup - the shared HTTP client stays open for other sessions
             await read_stream_writer.aclose()
-            await http_client.aclose()
         
     # ========================================
     # TOOL DISCOVERY & EXECUTION
@@ -652,22 +667,32 @@ class MCPClientService:
             raise
             
     async def get_all_tools(self) -> Dict[str, Dict[str, Any]]:
-        """Get tools from all connected clients"""
-        all_tools = {}
-        
-        for client_id, client_info in self.clients.items():
-            if client_info.status == ClientStatus.CONNECTED:
+        """Get tools from all connected clients, querying them concurrently"""
+        async def fetch_tools(client_id: str, client_info: MCPClientInfo) -> Optional[Dict[str, Any]]:
+            async with self._discovery_semaphore:
                 try:
                     tools = await self.get_client_tools(client_id)
-                    all_tools[client_id] = {
+                    return {
                         'client_name': client_info.config.name,
                         'tools': [asdict(tool) for tool in tools],
                         'count': len(tools)
                     }
                 except Exception as e:
                     logger.warning(f"Failed to get tools from {client_info.config.name}: {e}")
-                    
-        return all_tools
+                    return None
+        
+        connected = [
+            (client_id, client_info)
+            for client_id, client_info in self.clients.items()
+            if client_info.status == ClientStatus.CONNECTED
+        ]
+        results = await asyncio.gather(*(fetch_tools(client_id, client_info) for client_id, client_info in connected))
+        
+        return {
+            client_id: result
+            for (client_id, _), result in zip(connected, results)
+            if result is not None
+        }
         
     async def is_client_connected(self, client_id: str) -> bool:
         """Check if a client is connected"""
@@ -696,9 +721,9 @@ class MCPClientService:
                 continue  # Continue health checking
                 
     async def _perform_health_checks(self):
-        """Perform health checks on all connected clients"""
-        for client_id, client_info in self.clients.items():
-            if client_info.status == ClientStatus.CONNECTED:
+        """Perform health checks on all connected clients concurrently"""
+        async def check_client(client_id: str, client_info: MCPClientInfo):
+            async with self._discovery_semaphore:
                 try:
                     # Simple ping by listing tools
                     await self._discover_tools(client_id)
@@ -710,6 +735,12 @@ class MCPClientService:
                     # Attempt reconnection if auto_connect is enabled
                     if client_info.config.auto_connect:
                         await self._reconnect_client(client_id)
+        
+        await asyncio.gather(*(
+            check_client(client_id, client_info)
+            for client_id, client_info in list(self.clients.items())
+            if client_info.status == ClientStatus.CONNECTED
+        ))
 
 # Global service instance
 _mcp_client_service: Optional[MCPClientService] = None
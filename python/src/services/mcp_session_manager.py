@@ -5,9 +5,10 @@ This module provides simplified session management for MCP server connections,
 enabling clients to reconnect after server restarts.
 """
 
+import heapq
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,44 +25,60 @@ class SimplifiedSessionManager:
         """
         self.sessions: Dict[str, datetime] = {}  # session_id -> last_seen
         self.timeout = timeout
+        self._timeout_delta = timedelta(seconds=timeout)
+        # Min-heap of (expires_at, session_id). Entries go stale when a session is
+        # validated; cleanup re-pushes those lazily instead of updating on every hit.
+        self._expiry_heap: List[Tuple[datetime, str]] = []
         
     def create_session(self) -> str:
         """Create a new session and return its ID"""
         session_id = str(uuid.uuid4())
-        self.sessions[session_id] = datetime.now()
+        now = datetime.now()
+        self.sessions[session_id] = now
+        heapq.heappush(self._expiry_heap, (now + self._timeout_delta, session_id))
         logger.info(f"Created new session: {session_id}")
         return session_id
         
     def validate_session(self, session_id: str) -> bool:
         """Validate a session ID and update last seen time"""
-        if session_id not in self.sessions:
+        last_seen = self.sessions.get(session_id)
+        if last_seen is None:
             return False
             
-        last_seen = self.sessions[session_id]
-        if datetime.now() - last_seen > timedelta(seconds=self.timeout):
+        now = datetime.now()
+        if now - last_seen > self._timeout_delta:
             # Session expired, remove it
             del self.sessions[session_id]
             logger.info(f"Session {session_id} expired and removed")
             return False
             
         # Update last seen time
-        self.sessions[session_id] = datetime.now()
+        self.sessions[session_id] = now
         return True
         
     def cleanup_expired_sessions(self) -> int:
         """Remove expired sessions and return count of removed sessions"""
         now = datetime.now()
-        expired = []
+        heap = self._expiry_heap
+        removed = 0
         
-        for session_id, last_seen in self.sessions.items():
-            if now - last_seen > timedelta(seconds=self.timeout):
-                expired.append(session_id)
-                
-        for session_id in expired:
-            del self.sessions[session_id]
-            logger.info(f"Cleaned up expired session: {session_id}")
+        # Only entries whose recorded expiry has passed are visited
+        while heap and heap[0][0] < now:
+            _, session_id = heapq.heappop(heap)
+            last_seen = self.sessions.get(session_id)
+            if last_seen is None:
+                # Already removed by validate_session
+                continue
+            
+            if now - last_seen > self._timeout_delta:
+                del self.sessions[session_id]
+                removed += 1
+                logger.info(f"Cleaned up expired session: {session_id}")
+            else:
+                # Session was used since the entry was pushed - reschedule it
+                heapq.heappush(heap, (last_seen + self._timeout_delta, session_id))
             
-        return len(expired)
+        return removed
         
     def get_active_session_count(self) -> int:
         """Get count of active sessions"""
@@ -32,12 +32,13 @@ class DocumentService:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current project
-            project_response = self.supabase_client.table("projects").select("docs").eq("id", project_id).execute()
+            # Get current project docs and the updated_at version stamp
+            project_response = self.supabase_client.table("projects").select("docs, updated_at").eq("id", project_id).execute()
             if not project_response.data:
                 return False, {"error": f"Project with ID {project_id} not found"}
             
             current_docs = project_response.data[0].get("docs", [])
+            read_updated_at = project_response.data[0].get("updated_at")
             
             # Create new document entry
             new_doc = {
@@ -57,9 +58,7 @@ class DocumentService:
             updated_docs = current_docs + [new_doc]
             
             # Update project
-            response = self.supabase_client.table("projects").update({
-                "docs": updated_docs
-            }).eq("id", project_id).execute()
+            response = self._write_docs(project_id, updated_docs, read_updated_at)
             
             if response.data:
                 return True, {
@@ -72,6 +71,8 @@ class DocumentService:
                         "version": new_doc["version"]
                     }
                 }
+            elif read_updated_at:
+                return False, {"error": self._conflict_error(project_id)}
             else:
                 return False, {"error": "Failed to add document to project"}
                 
@@ -159,39 +160,25 @@ class DocumentService:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current project docs
-            project_response = self.supabase_client.table("projects").select("docs").eq("id", project_id).execute()
+            # Get current project docs along with the row's updated_at, which acts as
+            # the version stamp for the optimistic-locking check below
+            project_response = self.supabase_client.table("projects").select("docs, updated_at").eq("id", project_id).execute()
             if not project_response.data:
                 return False, {"error": f"Project with ID {project_id} not found"}
             
             current_docs = project_response.data[0].get("docs", [])
+            read_updated_at = project_response.data[0].get("updated_at")
             
-            # Create version snapshot if requested
-            if create_version and current_docs:
-                try:
-                    from .versioning_service import VersioningService
-                    versioning = VersioningService(self.supabase_client)
-                    
-                    change_summary = self._build_change_summary(doc_id, update_fields)
-                    versioning.create_version(
-                        project_id=project_id,
-                        field_name="docs",
-                        content=current_docs,
-                        change_summary=change_summary,
-                        change_type="update",
-                        document_id=doc_id,
-                        created_by=update_fields.get("author", "system")
-                    )
-                except Exception as version_error:
-                    logger.warning(f"Version creation failed for document {doc_id}: {version_error}")
-            
-            # Make a copy to modify
+            # Make a copy to modify - the edited entry is copied too so current_docs
+            # still holds the pre-update state for the version snapshot
             docs = current_docs.copy()
             
             # Find and update the document
             updated = False
             for i, doc in enumerate(docs):
                 if doc.get("id") == doc_id:
+                    docs[i] = dict(doc)
+                    
                     # Update allowed fields
                     if "title" in update_fields:
                         docs[i]["title"] = update_fields["title"]
@@ -214,12 +201,29 @@ class DocumentService:
                 return False, {"error": f"Document with ID {doc_id} not found in project {project_id}"}
             
             # Update the project
-            response = self.supabase_client.table("projects").update({
-                "docs": docs,
-                "updated_at": datetime.now().isoformat()
-            }).eq("id", project_id).execute()
+            response = self._write_docs(project_id, docs, read_updated_at)
             
             if response.data:
+                # Create version snapshot only once the write is confirmed, so a
+                # conflicting update leaves no orphaned version behind
+                if create_version and current_docs:
+                    try:
+                        from .versioning_service import VersioningService
+                        versioning = VersioningService(self.supabase_client)
+                        
+                        change_summary = self._build_change_summary(doc_id, update_fields)
+                        versioning.create_version(
+                            project_id=project_id,
+                            field_name="docs",
+                            content=current_docs,
+                            change_summary=change_summary,
+                            change_type="update",
+                            document_id=doc_id,
+                            created_by=update_fields.get("author", "system")
+                        )
+                    except Exception as version_error:
+                        logger.warning(f"Version creation failed for document {doc_id}: {version_error}")
+                
                 # Find the updated document to return
                 updated_doc = None
                 for doc in docs:
@@ -228,6 +232,8 @@ class DocumentService:
                         break
                 
                 return True, {"document": updated_doc}
+            elif read_updated_at:
+                return False, {"error": self._conflict_error(project_id)}
             else:
                 return False, {"error": "Failed to update document"}
                 
@@ -243,12 +249,13 @@ class DocumentService:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current project docs
-            project_response = self.supabase_client.table("projects").select("docs").eq("id", project_id).execute()
+            # Get current project docs and the updated_at version stamp
+            project_response = self.supabase_client.table("projects").select("docs, updated_at").eq("id", project_id).execute()
             if not project_response.data:
                 return False, {"error": f"Project with ID {project_id} not found"}
             
             docs = project_response.data[0].get("docs", [])
+            read_updated_at = project_response.data[0].get("updated_at")
             
             # Remove the document
             original_length = len(docs)
@@ -258,16 +265,15 @@ class DocumentService:
                 return False, {"error": f"Document with ID {doc_id} not found in project {project_id}"}
             
             # Update the project
-            response = self.supabase_client.table("projects").update({
-                "docs": docs,
-                "updated_at": datetime.now().isoformat()
-            }).eq("id", project_id).execute()
+            response = self._write_docs(project_id, docs, read_updated_at)
             
             if response.data:
                 return True, {
                     "project_id": project_id,
                     "doc_id": doc_id
                 }
+            elif read_updated_at:
+                return False, {"error": self._conflict_error(project_id)}
             else:
                 return False, {"error": "Failed to delete document"}
                 
@@ -275,6 +281,25 @@ class DocumentService:
             logger.error(f"Error deleting document: {e}")
             return False, {"error": f"Error deleting document: {str(e)}"}
     
+    def _write_docs(self, project_id: str, docs: List[Dict[str, Any]], read_updated_at: Optional[str]):
+        """
+        Write a project's docs array back, only if the project is unchanged since
+        it was read. updated_at acts as the version stamp (bumped by trigger on
+        every write), so a concurrent add/update/delete elsewhere in the array is
+        not overwritten; a conflict shows up as an empty response.data.
+        """
+        query = self.supabase_client.table("projects").update({
+            "docs": docs,
+            "updated_at": datetime.now().isoformat()
+        }).eq("id", project_id)
+        if read_updated_at:
+            query = query.eq("updated_at", read_updated_at)
+        return query.execute()
+    
+    def _conflict_error(self, project_id: str) -> str:
+        """Error message for a write rejected by the updated_at check"""
+        return f"Project {project_id} was modified concurrently; reload the document and retry"
+    
     def _build_change_summary(self, doc_id: str, update_fields: Dict[str, Any]) -> str:
         """Build a human-readable change summary"""
         changes = []
@@ -72,31 +72,75 @@ class ProjectService:
             logger.error(f"Error creating project: {e}")
             return False, {"error": f"Database error: {str(e)}"}
     
-    def list_projects(self) -> Tuple[bool, Dict[str, Any]]:
+    def list_projects(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[bool, Dict[str, Any]]:
         """
-        List all projects.
+        List projects, newest first.
+        
+        Args:
+            limit: Maximum number of projects to return, at least 1 (default: all)
+            cursor: next_cursor from the previous page; only projects after it in
+                    (created_at, id) order are returned (keyset pagination, no OFFSET scan)
         
         Returns:
-            Tuple of (success, result_dict)
+            Tuple of (success, result_dict). total_count is the number of projects
+            in this response (the page size when limit is set); next_cursor is
+            included when limit is set.
         """
         try:
-            response = self.supabase_client.table("projects").select("*").order("created_at", desc=True).execute()
+            if limit is not None and limit < 1:
+                return False, {"error": f"Invalid limit {limit}; must be at least 1"}
+            
+            # Only the listed columns - skips the docs/features/data JSONB payloads
+            query = self.supabase_client.table("projects").select("id, title, github_repo, created_at, updated_at")
+            
+            if cursor:
+                # created_at is not unique (rows inserted in one transaction share now()),
+                # so the keyset is (created_at, id) with id breaking ties
+                cursor_created_at, _, cursor_id = cursor.rpartition("|")
+                
+                # Both parts are interpolated into the filter, so only accept a real
+                # timestamp and UUID - anything else could inject PostgREST filter terms
+                try:
+                    datetime.fromisoformat(cursor_created_at)
+                    cursor_id = str(uuid.UUID(cursor_id))
+                except ValueError:
+                    return False, {"error": f"Invalid cursor '{cursor}'"}
+                
+                query = query.or_(
+                    f'created_at.lt."{cursor_created_at}",'
+                    f'and(created_at.eq."{cursor_created_at}",id.lt."{cursor_id}")'
+                )
+            
+            query = query.order("created_at", desc=True).order("id", desc=True)
             
-            projects = []
-            for project in response.data:
-                projects.append({
+            if limit is not None:
+                query = query.limit(limit)
+            
+            response = query.execute()
+            
+            projects = [
+                {
                     "id": project["id"],
                     "title": project["title"],
                     "github_repo": project.get("github_repo"),
                     "created_at": project["created_at"],
                     "updated_at": project["updated_at"]
-                })
+                }
+                for project in response.data
+            ]
             
-            return True, {
+            result = {
                 "projects": projects,
                 "total_count": len(projects)
             }
             
+            if limit is not None:
+                # A full page means there may be more; hand back the keyset cursor
+                last = projects[-1] if len(projects) == limit else None
+                result["next_cursor"] = f"{last['created_at']}|{last['id']}" if last else None
+            
+            return True, result
+            
         except Exception as e:
             logger.error(f"Error listing projects: {e}")
             return False, {"error": f"Error listing projects: {str(e)}"}
@@ -109,37 +153,40 @@ class ProjectService:
             Tuple of (success, result_dict)
         """
         try:
-            response = self.supabase_client.table("projects").select("*").eq("id", project_id).execute()
+            # Embed the project_sources links in the same request (FK on project_id).
+            # If the embed fails (e.g. relationship missing from the schema cache),
+            # fall back to a plain project read and a separate links query.
+            links_embedded = True
+            try:
+                response = self.supabase_client.table("projects").select("*, project_sources(source_id, notes)").eq("id", project_id).execute()
+            except Exception as e:
+                logger.warning(f"Embedded project_sources lookup failed for project {project_id}, falling back: {e}")
+                links_embedded = False
+                response = self.supabase_client.table("projects").select("*").eq("id", project_id).execute()
             
             if response.data:
                 project = response.data[0]
+                source_links = project.pop("project_sources", None) or []
                 
                 # Get linked sources
                 technical_sources = []
                 business_sources = []
                 
                 try:
-                    # Get source IDs from project_sources table
-                    sources_response = self.supabase_client.table("project_sources").select("source_id, notes").eq("project_id", project["id"]).execute()
+                    if not links_embedded:
+                        # Get source IDs from project_sources table
+                        source_links = self.supabase_client.table("project_sources").select("source_id, notes").eq("project_id", project["id"]).execute().data
                     
                     # Collect source IDs by type
-                    technical_source_ids = []
-                    business_source_ids = []
-                    
-                    for source_link in sources_response.data:
-                        if source_link.get("notes") == "technical":
-                            technical_source_ids.append(source_link["source_id"])
-                        elif source_link.get("notes") == "business":
-                            business_source_ids.append(source_link["source_id"])
-                    
-                    # Fetch full source objects
-                    if technical_source_ids:
-                        tech_sources_response = self.supabase_client.table("sources").select("*").in_("source_id", technical_source_ids).execute()
-                        technical_sources = tech_sources_response.data
+                    technical_source_ids = [link["source_id"] for link in source_links if link.get("notes") == "technical"]
+                    business_source_ids = [link["source_id"] for link in source_links if link.get("notes") == "business"]
                     
-                    if business_source_ids:
-                        biz_sources_response = self.supabase_client.table("sources").select("*").in_("source_id", business_source_ids).execute()
-                        business_sources = biz_sources_response.data
+                    # Fetch full source objects for both types in one query
+                    if technical_source_ids or business_source_ids:
+                        sources_response = self.supabase_client.table("sources").select("*").in_("source_id", technical_source_ids + business_source_ids).execute()
+                        sources_by_id = {source["source_id"]: source for source in sources_response.data}
+                        technical_sources = [sources_by_id[sid] for sid in technical_source_ids if sid in sources_by_id]
+                        business_sources = [sources_by_id[sid] for sid in business_source_ids if sid in sources_by_id]
                         
                 except Exception as e:
                     logger.warning(f"Failed to retrieve linked sources for project {project['id']}: {e}")
@@ -164,9 +211,10 @@ class ProjectService:
             Tuple of (success, result_dict)
         """
         try:
-            # First, get task count for reporting
-            tasks_response = self.supabase_client.table("tasks").select("id").eq("project_id", project_id).execute()
-            tasks_count = len(tasks_response.data) if tasks_response.data else 0
+            # First, get task count for reporting - a HEAD request with an exact count
+            # avoids transferring every task ID just to measure the list
+            tasks_response = self.supabase_client.table("tasks").select("id", count="exact", head=True).eq("project_id", project_id).execute()
+            tasks_count = tasks_response.count or 0
             
             # Delete the project (tasks will be deleted by cascade)
             response = self.supabase_client.table("projects").delete().eq("id", project_id).execute()
@@ -35,6 +35,9 @@ class TaskService:
     VALID_STATUSES = ['todo', 'doing', 'review', 'done']
     VALID_ASSIGNEES = ['User', 'Archon', 'AI IDE Agent']
     
+    # Columns returned by list_tasks - skips the sources/code_examples JSONB payloads
+    LIST_COLUMNS = "id, project_id, parent_task_id, title, description, status, assignee, task_order, created_at, updated_at"
+    
     def __init__(self, supabase_client=None):
         """Initialize with optional supabase client"""
         self.supabase_client = supabase_client or get_supabase_client()
@@ -141,7 +144,7 @@ class TaskService:
         """
         try:
             # Build query - always filter out archived tasks
-            query = self.supabase_client.table("tasks").select("*").or_("archived.is.null,archived.eq.false")
+            query = self.supabase_client.table("tasks").select(self.LIST_COLUMNS).or_("archived.is.null,archived.eq.false")
             
             # Apply filters
             if project_id:
@@ -162,9 +165,8 @@ class TaskService:
             
             response = query.order("task_order", desc=False).order("created_at", desc=False).execute()
             
-            tasks = []
-            for task in response.data:
-                tasks.append({
+            tasks = [
+                {
                     "id": task["id"],
                     "project_id": task["project_id"],
                     "parent_task_id": task.get("parent_task_id"),
@@ -175,7 +177,9 @@ class TaskService:
                     "task_order": task.get("task_order", 0),
                     "created_at": task["created_at"],
                     "updated_at": task["updated_at"]
-                })
+                }
+                for task in response.data
+            ]
             
             filter_info = []
             if project_id:
@@ -8,6 +8,7 @@ import json
 from supabase import create_client, Client
 from urllib.parse import urlparse
 import openai
+import random
 import re
 import time
 import asyncio
@@ -39,37 +40,87 @@ def get_openai_api_key_sync() -> Optional[str]:
     """
     return os.getenv("OPENAI_API_KEY")
 
+def _jittered_delay(base_delay: float) -> float:
+    """
+    Randomize a retry backoff delay to between 50% and 150% of its base value,
+    so concurrent callers that failed together do not all retry in lockstep.
+    """
+    return base_delay * random.uniform(0.5, 1.5)
+
+# Process-wide Supabase client, shared by every service so the underlying
+# HTTP connection pool is reused instead of rebuilt per request
+_supabase_client: Optional[Client] = None
+_supabase_client_config: Optional[Tuple[str, str]] = None
+_supabase_client_lock = threading.Lock()
+
 def get_supabase_client() -> Client:
     """
     Get a Supabase client with the URL and key from environment variables.
-    Uses the standard Supabase client initialization.
+    The client is created once and cached for the process; it is only
+    rebuilt if the URL or key in the environment changes.
     
     Returns:
         Supabase client instance
     """
+    global _supabase_client, _supabase_client_config
+    
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_SERVICE_KEY")
     
     if not url or not key:
         raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set in environment variables")
     
-    try:
-        # Initialize with standard Supabase client - no need for custom headers
-        client = create_client(url, key)
-        
-        # Extract project ID from URL for logging purposes only
-        import re
-        match = re.match(r'https://([^.]+)\.supabase\.co', url)
-        if match:
-            project_id = match.group(1)
-            print(f"Supabase client initialized for project: {project_id}")
-        else:
-            print("Supabase client initialized successfully")
-        
+    client = _supabase_client
+    if client is not None and _supabase_client_config == (url, key):
         return client
-    except Exception as e:
-        logging.error(f"Error initializing Supabase client: {e}")
-        raise
+    
+    with _supabase_client_lock:
+        # Another thread may have initialized the client while we waited
+        if _supabase_client is not None and _supabase_client_config == (url, key):
+            return _supabase_client
+        
+        try:
+            # Initialize with standard Supabase client - no need for custom headers
+            client = create_client(url, key)
+            
+            # Extract project ID from URL for logging purposes only
+            match = re.match(r'https://([^.]+)\.supabase\.co', url)
+            if match:
+                project_id = match.group(1)
+                print(f"Supabase client initialized for project: {project_id}")
+            else:
+                print("Supabase client initialized successfully")
+            
+            _supabase_client = client
+            _supabase_client_config = (url, key)
+            return client
+        except Exception as e:
+            logging.error(f"Error initializing Supabase client: {e}")
+            raise
+
+def reset_supabase_client() -> None:
+    """Drop the cached Supabase client so the next call to get_supabase_client rebuilds it."""
+    global _supabase_client, _supabase_client_config
+    
+    with _supabase_client_lock:
+        _supabase_client = None
+        _supabase_client_config = None
+
+# OpenAI client reused across embedding batches so its HTTP connection pool
+# (and TLS session) survives between calls
+_embedding_client: Optional[openai.OpenAI] = None
+_embedding_client_key: Optional[str] = None
+_embedding_client_lock = threading.Lock()
+
+def _get_embedding_client(api_key: str) -> openai.OpenAI:
+    """Return the cached OpenAI client for embeddings, rebuilding it if the API key changed."""
+    global _embedding_client, _embedding_client_key
+    
+    with _embedding_client_lock:
+        if _embedding_client is None or _embedding_client_key != api_key:
+            _embedding_client = openai.OpenAI(api_key=api_key)
+            _embedding_client_key = api_key
+        return _embedding_client
 
 def create_embeddings_batch(texts: List[str]) -> List[List[float]]:
     """
@@ -90,8 +141,8 @@ def create_embeddings_batch(texts: List[str]) -> List[List[float]]:
         print("ERROR: No OpenAI API key found in environment")
         return [[0.0] * 1536 for _ in texts]
     
-    # Create OpenAI client with the API key
-    client = openai.OpenAI(api_key=api_key)
+    # Reuse the OpenAI client for this API key
+    client = _get_embedding_client(api_key)
     
     max_retries = 3
     retry_delay = 1.0  # Start with 1 second delay
@@ -106,8 +157,9 @@ def create_embeddings_batch(texts: List[str]) -> List[List[float]]:
         except Exception as e:
             if retry < max_retries - 1:
                 print(f"Error creating batch embeddings (attempt {retry + 1}/{max_retries}): {e}")
-                print(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+                delay = _jittered_delay(retry_delay)
+                print(f"Retrying in {delay:.2f} seconds...")
+                time.sleep(delay)
                 retry_delay *= 2  # Exponential backoff
             else:
                 print(f"Failed to create batch embeddings after {max_retries} attempts: {e}")
@@ -264,13 +316,14 @@ async def add_documents_to_supabase(
     try:
         if unique_urls:
             # Use the .in_() filter to delete all records with matching URLs
-            client.table("crawled_pages").delete().in_("url", unique_urls).execute()
+            # (run off the event loop - the Supabase client is synchronous)
+            await asyncio.to_thread(client.table("crawled_pages").delete().in_("url", unique_urls).execute)
     except Exception as e:
         print(f"Batch delete failed: {e}. Trying one-by-one deletion as fallback.")
         # Fallback: delete records one by one
         for url in unique_urls:
             try:
-                client.table("crawled_pages").delete().eq("url", url).execute()
+                await asyncio.to_thread(client.table("crawled_pages").delete().eq("url", url).execute)
             except Exception as inner_e:
                 print(f"Error deleting record for URL {url}: {inner_e}")
                 # Continue with the next URL even if one fails
@@ -336,25 +389,28 @@ async def add_documents_to_supabase(
             estimated_tokens = (5000 + avg_chunk_size) * len(batch_contents) // 4  # Rough estimate: 1 token = 4 chars
             print(f"Estimated tokens for this batch: ~{estimated_tokens:,} tokens")
             
-            # Process in parallel using ThreadPoolExecutor
+            # Process in parallel using ThreadPoolExecutor, awaiting the results so
+            # the event loop keeps serving other requests during the LLM calls
             contextual_contents = [None] * len(batch_contents)  # Pre-allocate with None
+            loop = asyncio.get_running_loop()
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all tasks and collect results
-                future_to_idx = {executor.submit(process_chunk_with_context, arg): idx 
-                                for idx, arg in enumerate(process_args)}
+                # Submit all tasks; gather returns results in submission order
+                outcomes = await asyncio.gather(
+                    *(loop.run_in_executor(executor, process_chunk_with_context, arg) for arg in process_args),
+                    return_exceptions=True
+                )
+            
+            for idx, outcome in enumerate(outcomes):
+                if isinstance(outcome, BaseException):
+                    print(f"Error processing chunk {idx}: {outcome}")
+                    # Use original content as fallback
+                    contextual_contents[idx] = batch_contents[idx]
+                    continue
                 
-                # Process results as they complete, but store in correct order
-                for future in concurrent.futures.as_completed(future_to_idx):
-                    idx = future_to_idx[future]
-                    try:
-                        result, success = future.result()
-                        contextual_contents[idx] = result  # Store in correct position!
-                        if success:
-                            batch_metadatas[idx]["contextual_embedding"] = True
-                    except Exception as e:
-                        print(f"Error processing chunk {idx}: {e}")
-                        # Use original content as fallback
-                        contextual_contents[idx] = batch_contents[idx]
+                result, success = outcome
+                contextual_contents[idx] = result  # Store in correct position!
+                if success:
+                    batch_metadatas[idx]["contextual_embedding"] = True
             
             # Check for any None values and replace with original content
             for idx, content in enumerate(contextual_contents):
@@ -370,7 +426,8 @@ async def add_documents_to_supabase(
         embeddings_percentage = overall_percentage + int((10 / 100) * (100 / total_batches))
         await report_progress(embeddings_msg, min(embeddings_percentage, 99))
         # TODO: Pass cached API key to this function when called from context
-        batch_embeddings = create_embeddings_batch(contextual_contents)
+        # Run the blocking OpenAI call (and its retry sleeps) off the event loop
+        batch_embeddings = await asyncio.to_thread(create_embeddings_batch, contextual_contents)
         
         batch_data = []
         for j in range(len(contextual_contents)):
@@ -406,7 +463,8 @@ async def add_documents_to_supabase(
         
         for retry in range(max_retries):
             try:
-                client.table("crawled_pages").insert(batch_data).execute()
+                # The Supabase client is synchronous - keep the HTTP call off the event loop
+                await asyncio.to_thread(client.table("crawled_pages").insert(batch_data).execute)
                 # Success - report completion of this batch
                 # Use consistent calculation based on documents processed
                 completion_percentage = int(batch_end / len(contents) * 100)
@@ -417,8 +475,10 @@ async def add_documents_to_supabase(
             except Exception as e:
                 if retry < max_retries - 1:
                     print(f"Error inserting batch into Supabase (attempt {retry + 1}/{max_retries}): {e}")
-                    print(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    delay = _jittered_delay(retry_delay)
+                    print(f"Retrying in {delay:.2f} seconds...")
+                    # Yield to the event loop instead of blocking other crawls/requests
+                    await asyncio.sleep(delay)
                     retry_delay *= 2  # Exponential backoff
                 else:
                     # Final attempt failed
@@ -428,7 +488,7 @@ async def add_documents_to_supabase(
                     successful_inserts = 0
                     for record in batch_data:
                         try:
-                            client.table("crawled_pages").insert(record).execute()
+                            await asyncio.to_thread(client.table("crawled_pages").insert(record).execute)
                             successful_inserts += 1
                         except Exception as individual_error:
                             print(f"Failed to insert individual record for URL {record['url']}: {individual_error}")
@@ -441,7 +501,7 @@ async def add_documents_to_supabase(
             # Reduced delay - with 5k context we use much fewer tokens
             delay = 1.5 if use_contextual_embeddings else 0.5
             print(f"Waiting {delay} seconds before processing next batch...")
-            time.sleep(delay)
+            await asyncio.sleep(delay)
     
     # Report final completion
     await report_progress(f"Successfully stored all {len(contents)} documents", 100)
@@ -750,7 +810,8 @@ def add_code_examples_to_supabase(
         # Check if embeddings are valid (not all zeros)
         valid_embeddings = []
         for embedding in embeddings:
-            if embedding and not all(v == 0.0 for v in embedding):
+            # any() scans the floats in C; a zero vector is all-falsy
+            if embedding and any(embedding):
                 valid_embeddings.append(embedding)
             else:
                 print(f"Warning: Zero or invalid embedding detected, creating new one...")
@@ -789,8 +850,9 @@ def add_code_examples_to_supabase(
             except Exception as e:
                 if retry < max_retries - 1:
                     print(f"Error inserting batch into Supabase (attempt {retry + 1}/{max_retries}): {e}")
-                    print(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    delay = _jittered_delay(retry_delay)
+                    print(f"Retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
                     retry_delay *= 2  # Exponential backoff
                 else:
                     # Final attempt failed
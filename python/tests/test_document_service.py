@@ -0,0 +1,102 @@
+"""
+Test DocumentService optimistic locking on the projects.docs array, and update_document versioning.
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+from src.services.projects.document_service import DocumentService
+
+
+PROJECT_ID = "project-123"
+DOC_ID = "doc-1"
+READ_UPDATED_AT = "2025-01-01T12:00:00.000000+00:00"
+
+
+def make_client(update_data):
+    """Mock Supabase client: the select returns one doc, the conditional update returns update_data."""
+    client = MagicMock()
+    table = client.table.return_value
+
+    table.select.return_value.eq.return_value.execute.return_value = Mock(data=[{
+        "docs": [{"id": DOC_ID, "title": "Original", "content": {}}],
+        "updated_at": READ_UPDATED_AT
+    }])
+
+    update_query = table.update.return_value.eq.return_value
+    update_query.eq.return_value.execute.return_value = Mock(data=update_data)
+
+    return client, update_query
+
+
+class TestUpdateDocument:
+    """Test the conditional write in update_document."""
+
+    def test_update_filters_on_read_updated_at(self):
+        """The write is conditioned on the updated_at value that was read."""
+        client, update_query = make_client(update_data=[{"id": PROJECT_ID}])
+
+        with patch("src.services.projects.versioning_service.VersioningService") as versioning_cls:
+            success, result = DocumentService(client).update_document(PROJECT_ID, DOC_ID, {"title": "Changed"})
+
+        assert success
+        assert result["document"]["title"] == "Changed"
+        update_query.eq.assert_called_once_with("updated_at", READ_UPDATED_AT)
+
+        # The snapshot holds the pre-update docs
+        versioning_cls.return_value.create_version.assert_called_once()
+        snapshot = versioning_cls.return_value.create_version.call_args.kwargs["content"]
+        assert snapshot[0]["title"] == "Original"
+
+    def test_concurrent_modification_returns_conflict(self):
+        """A zero-row conditional update reports a conflict and creates no version."""
+        client, _ = make_client(update_data=[])
+
+        with patch("src.services.projects.versioning_service.VersioningService") as versioning_cls:
+            success, result = DocumentService(client).update_document(PROJECT_ID, DOC_ID, {"title": "Changed"})
+
+        assert not success
+        assert "modified concurrently" in result["error"]
+        versioning_cls.return_value.create_version.assert_not_called()
+
+
+class TestAddAndDeleteDocument:
+    """Test that add_document and delete_document use the same conditional write."""
+
+    def test_add_filters_on_read_updated_at(self):
+        """add_document conditions its write on the updated_at value that was read."""
+        client, update_query = make_client(update_data=[{"id": PROJECT_ID}])
+
+        success, _ = DocumentService(client).add_document(PROJECT_ID, "spec", "New doc")
+
+        assert success
+        update_query.eq.assert_called_once_with("updated_at", READ_UPDATED_AT)
+        written_docs = client.table.return_value.update.call_args.args[0]["docs"]
+        assert [doc["title"] for doc in written_docs] == ["Original", "New doc"]
+
+    def test_add_concurrent_modification_returns_conflict(self):
+        """A zero-row conditional update from add_document reports a conflict."""
+        client, _ = make_client(update_data=[])
+
+        success, result = DocumentService(client).add_document(PROJECT_ID, "spec", "New doc")
+
+        assert not success
+        assert "modified concurrently" in result["error"]
+
+    def test_delete_filters_on_read_updated_at(self):
+        """delete_document conditions its write on the updated_at value that was read."""
+        client, update_query = make_client(update_data=[{"id": PROJECT_ID}])
+
+        success, _ = DocumentService(client).delete_document(PROJECT_ID, DOC_ID)
+
+        assert success
+        update_query.eq.assert_called_once_with("updated_at", READ_UPDATED_AT)
+        assert client.table.return_value.update.call_args.args[0]["docs"] == []
+
+    def test_delete_concurrent_modification_returns_conflict(self):
+        """A zero-row conditional update from delete_document reports a conflict."""
+        client, _ = make_client(update_data=[])
+
+        success, result = DocumentService(client).delete_document(PROJECT_ID, DOC_ID)
+
+        assert not success
+        assert "modified concurrently" in result["error"]
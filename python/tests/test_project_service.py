@@ -0,0 +1,195 @@
+"""
+Test ProjectService queries against a mocked Supabase client.
+"""
+
+import re
+from unittest.mock import MagicMock, Mock
+
+from src.services.projects.project_service import ProjectService
+
+
+PROJECT_ID = "project-123"
+
+
+def make_get_project_client(embed_fails: bool):
+    """Mock client for get_project; optionally make the embedded project_sources select fail."""
+    tables = {name: MagicMock() for name in ("projects", "project_sources", "sources")}
+    client = MagicMock()
+    client.table.side_effect = lambda name: tables[name]
+
+    links = [
+        {"source_id": "docs.example.com", "notes": "technical"},
+        {"source_id": "biz.example.com", "notes": "business"},
+    ]
+
+    def select_project(columns):
+        query = MagicMock()
+        if "project_sources" in columns:
+            if embed_fails:
+                query.eq.return_value.execute.side_effect = Exception("Could not find a relationship")
+            else:
+                query.eq.return_value.execute.return_value = Mock(data=[
+                    {"id": PROJECT_ID, "title": "Project", "project_sources": links}
+                ])
+        else:
+            query.eq.return_value.execute.return_value = Mock(data=[{"id": PROJECT_ID, "title": "Project"}])
+        return query
+
+    tables["projects"].select.side_effect = select_project
+    tables["project_sources"].select.return_value.eq.return_value.execute.return_value = Mock(data=links)
+    tables["sources"].select.return_value.in_.return_value.execute.return_value = Mock(data=[
+        {"source_id": "biz.example.com"},
+        {"source_id": "docs.example.com"},
+    ])
+
+    return client, tables
+
+
+class TestGetProject:
+    """Test get_project source lookup."""
+
+    def test_sources_from_embedded_links(self):
+        """Links come from the embedded select; both source types are fetched in one query."""
+        client, tables = make_get_project_client(embed_fails=False)
+
+        success, result = ProjectService(client).get_project(PROJECT_ID)
+
+        assert success
+        project = result["project"]
+        assert "project_sources" not in project
+        assert project["technical_sources"] == [{"source_id": "docs.example.com"}]
+        assert project["business_sources"] == [{"source_id": "biz.example.com"}]
+        tables["project_sources"].select.assert_not_called()
+        tables["sources"].select.assert_called_once()
+
+    def test_falls_back_when_embed_fails(self):
+        """An embed error falls back to separate queries instead of failing the read."""
+        client, tables = make_get_project_client(embed_fails=True)
+
+        success, result = ProjectService(client).get_project(PROJECT_ID)
+
+        assert success
+        project = result["project"]
+        assert project["technical_sources"] == [{"source_id": "docs.example.com"}]
+        assert project["business_sources"] == [{"source_id": "biz.example.com"}]
+        tables["project_sources"].select.assert_called_once_with("source_id, notes")
+
+
+class FakeProjectsQuery:
+    """Minimal PostgREST-style query over in-memory rows supporting the list_projects keyset."""
+
+    KEYSET_FILTER = re.compile(
+        r'^created_at\.lt\."(?P<ts>[^"]+)",and\(created_at\.eq\."(?P=ts)",id\.lt\."(?P<id>[^"]+)"\)$'
+    )
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.orders = []
+        self.row_limit = None
+
+    def select(self, columns):
+        return self
+
+    def or_(self, filters):
+        match = self.KEYSET_FILTER.match(filters)
+        assert match, f"unexpected filter: {filters}"
+        key = (match["ts"], match["id"])
+        self.rows = [row for row in self.rows if (row["created_at"], row["id"]) < key]
+        return self
+
+    def order(self, column, desc=False):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, count):
+        self.row_limit = count
+        return self
+
+    def execute(self):
+        assert self.orders == [("created_at", True), ("id", True)]
+        rows = sorted(self.rows, key=lambda row: (row["created_at"], row["id"]), reverse=True)
+        return Mock(data=rows[:self.row_limit] if self.row_limit else rows)
+
+
+class TestListProjects:
+    """Test keyset pagination in list_projects."""
+
+    NEWEST_ID = "ffffffff-0000-0000-0000-000000000000"
+    OLDEST_ID = "00000000-0000-0000-0000-000000000000"
+
+    @staticmethod
+    def shared_id(i):
+        return f"00000000-0000-0000-0000-00000000000{i}"
+
+    def make_rows(self):
+        # Five projects inserted in one transaction share a created_at value
+        shared = "2025-01-01T12:00:00.123456+00:00"
+        rows = [
+            {"id": self.shared_id(i), "title": f"Project {i}", "created_at": shared, "updated_at": shared}
+            for i in range(5)
+        ]
+        rows.append({"id": self.NEWEST_ID, "title": "Newest", "created_at": "2025-01-02T00:00:00+00:00", "updated_at": "x"})
+        rows.append({"id": self.OLDEST_ID, "title": "Oldest", "created_at": "2024-12-31T00:00:00+00:00", "updated_at": "x"})
+        return rows
+
+    def make_service(self):
+        rows = self.make_rows()
+        client = MagicMock()
+        client.table.side_effect = lambda name: FakeProjectsQuery(rows)
+        return ProjectService(client)
+
+    def test_pages_through_rows_sharing_created_at(self):
+        """Paging with a small limit returns every project exactly once, in order."""
+        rows = self.make_rows()
+        client = MagicMock()
+        client.table.side_effect = lambda name: FakeProjectsQuery(rows)
+        service = ProjectService(client)
+
+        seen = []
+        cursor = None
+        while True:
+            success, result = service.list_projects(limit=2, cursor=cursor)
+            assert success
+            seen.extend(project["id"] for project in result["projects"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == [self.NEWEST_ID] + [self.shared_id(i) for i in range(4, -1, -1)] + [self.OLDEST_ID]
+
+    def test_unpaged_list_has_no_cursor(self):
+        """Without a limit, all projects are returned and no cursor key is added."""
+        rows = self.make_rows()
+        client = MagicMock()
+        client.table.side_effect = lambda name: FakeProjectsQuery(rows)
+
+        success, result = ProjectService(client).list_projects()
+
+        assert success
+        assert result["total_count"] == len(rows)
+        assert "next_cursor" not in result
+
+    def test_invalid_cursor(self):
+        """Cursors that are not a timestamp|UUID pair are rejected before reaching the filter."""
+        service = self.make_service()
+        shared = "2025-01-01T12:00:00.123456+00:00"
+        invalid_cursors = [
+            "not-a-cursor",
+            f"{shared}|not-a-uuid",
+            f'{shared}|{self.OLDEST_ID}",title.eq."x',
+            f'{shared}"),id.gt.(x|{self.OLDEST_ID}',
+        ]
+
+        for cursor in invalid_cursors:
+            success, result = service.list_projects(limit=2, cursor=cursor)
+            assert not success, cursor
+            assert "Invalid cursor" in result["error"]
+
+    def test_invalid_limit(self):
+        """A limit below 1 is rejected instead of reaching PostgREST or meaning 'all'."""
+        service = self.make_service()
+
+        for limit in (0, -5):
+            success, result = service.list_projects(limit=limit)
+            assert not success
+            assert "Invalid limit" in result["error"]
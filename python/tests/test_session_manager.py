@@ -0,0 +1,77 @@
+"""
+Test SimplifiedSessionManager expiry tracking.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.services.mcp_session_manager import SimplifiedSessionManager
+
+
+class FakeClock:
+    """Controllable replacement for datetime.now() inside the session manager."""
+
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def now(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: float):
+        self.current += timedelta(seconds=seconds)
+
+
+class TestSimplifiedSessionManager:
+    """Test heap-based cleanup of expired sessions."""
+
+    def setup_method(self):
+        self.clock = FakeClock(datetime(2025, 1, 1, 12, 0, 0))
+        self.patcher = patch("src.services.mcp_session_manager.datetime", self.clock)
+        self.patcher.start()
+        self.manager = SimplifiedSessionManager(timeout=60)
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def test_cleanup_removes_expired_session(self):
+        """An idle session past its timeout is removed and its heap entry dropped."""
+        session_id = self.manager.create_session()
+
+        self.clock.advance(30)
+        assert self.manager.cleanup_expired_sessions() == 0
+        assert session_id in self.manager.sessions
+
+        self.clock.advance(31)
+        assert self.manager.cleanup_expired_sessions() == 1
+        assert session_id not in self.manager.sessions
+        assert self.manager._expiry_heap == []
+
+    def test_cleanup_reschedules_validated_session(self):
+        """A session validated after its heap entry was pushed is kept and rescheduled."""
+        session_id = self.manager.create_session()
+
+        # Touch the session shortly before its original expiry
+        self.clock.advance(50)
+        assert self.manager.validate_session(session_id)
+        validated_at = self.clock.now()
+
+        # Past the original expiry, but within the timeout of the last validation
+        self.clock.advance(20)
+        assert self.manager.cleanup_expired_sessions() == 0
+        assert session_id in self.manager.sessions
+        assert self.manager._expiry_heap == [(validated_at + timedelta(seconds=60), session_id)]
+
+        # Once the rescheduled expiry passes, the session is cleaned up
+        self.clock.advance(41)
+        assert self.manager.cleanup_expired_sessions() == 1
+        assert session_id not in self.manager.sessions
+        assert self.manager._expiry_heap == []
+
+    def test_cleanup_skips_sessions_removed_by_validation(self):
+        """Heap entries for sessions already expired by validate_session are discarded."""
+        session_id = self.manager.create_session()
+
+        self.clock.advance(61)
+        assert not self.manager.validate_session(session_id)
+        assert self.manager.cleanup_expired_sessions() == 0
+        assert self.manager._expiry_heap == []
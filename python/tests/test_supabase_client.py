@@ -0,0 +1,57 @@
+"""
+Test the process-wide Supabase client cache in src.utils.
+"""
+
+import os
+from unittest.mock import patch
+
+from src.utils import get_supabase_client, reset_supabase_client
+
+
+ENV = {
+    "SUPABASE_URL": "https://example.supabase.co",
+    "SUPABASE_SERVICE_KEY": "service-key-1",
+}
+
+
+class TestGetSupabaseClient:
+    """Test caching and rebuilding of the shared Supabase client."""
+
+    def setup_method(self):
+        reset_supabase_client()
+
+    def teardown_method(self):
+        reset_supabase_client()
+
+    def test_get_supabase_client_returns_singleton(self):
+        """Repeated calls with the same environment build one client."""
+        with patch.dict(os.environ, ENV), patch("src.utils.create_client") as create_client:
+            first = get_supabase_client()
+            second = get_supabase_client()
+
+        assert first is second
+        create_client.assert_called_once_with(ENV["SUPABASE_URL"], ENV["SUPABASE_SERVICE_KEY"])
+
+    def test_changed_key_rebuilds_client(self):
+        """A different SUPABASE_SERVICE_KEY builds a new client."""
+        with patch.dict(os.environ, ENV), patch("src.utils.create_client") as create_client:
+            create_client.side_effect = lambda url, key: object()
+            first = get_supabase_client()
+
+            with patch.dict(os.environ, {"SUPABASE_SERVICE_KEY": "service-key-2"}):
+                second = get_supabase_client()
+
+        assert first is not second
+        assert create_client.call_count == 2
+        assert create_client.call_args.args == (ENV["SUPABASE_URL"], "service-key-2")
+
+    def test_reset_rebuilds_client(self):
+        """After reset_supabase_client, the next call builds a fresh client."""
+        with patch.dict(os.environ, ENV), patch("src.utils.create_client") as create_client:
+            create_client.side_effect = lambda url, key: object()
+            first = get_supabase_client()
+            reset_supabase_client()
+            second = get_supabase_client()
+
+        assert first is not second
+        assert create_client.call_count == 2